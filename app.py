@@ -1,11 +1,16 @@
 import streamlit as st
-import google.generativeai as genai
 import os
-import PyPDF2 as pdf
 from dotenv import load_dotenv
+import hashlib
 import json
+import orjson
+import string
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -25,126 +30,427 @@ try:
     if not api_key:
         logger.error("GOOGLE_API_KEY not found in environment variables")
         st.error("API key not configured. Please check your .env file.")
-    else:
-        genai.configure(api_key=api_key)
-        logger.info("Google API configured successfully")
 except Exception as e:
     logger.error(f"Error loading environment: {str(e)}")
     st.error(f"Configuration error: {str(e)}")
 
-def get_gemini_response(input_text: str) -> Optional[str]:
-    """Generate a response from the Gemini model with proper error handling"""
+# HTML/CSS templates, kept in one place so the display code stays readable
+_CSS = """
+<style>
+.main {
+    background-color: #000000;
+}
+div.block-container {
+    padding-top: 2rem;
+}
+h1, h2, h3 {
+    color: #2c3e50;
+}
+.stButton>button {
+    background-color: #4e89ae;
+    color: white;
+    font-weight: bold;
+    height: 3em;
+    border-radius: 0.5rem;
+}
+.stButton>button:hover {
+    background-color: #2c3e50;
+    color: white;
+}
+</style>
+"""
+
+_GAUGE_TPL = string.Template("""
+<h1 style='text-align: center; color: $color;'>$match_percentage</h1>
+<h3 style='text-align: center;'>$emoji $message</h3>
+<div style="display: flex; justify-content: center; margin: 20px 0;">
+    <svg viewBox="0 0 36 36" width="200" height="200">
+        <circle cx="18" cy="18" r="15.9155" fill="white" stroke="#f3f3f3" stroke-width="4.5"/>
+        <circle cx="18" cy="18" r="15.9155" fill="none" stroke="$color" stroke-width="4.5"
+            stroke-dasharray="$match_value, 100" transform="rotate(-90 18 18)"/>
+        <text x="18" y="18" text-anchor="middle" dominant-baseline="central"
+            font-size="4.5" font-weight="bold" fill="black">$match_percentage</text>
+    </svg>
+</div>
+""")
+
+_STRENGTH_TPL = string.Template("""
+<div style="
+    background-color: #000000;
+    border-left: 5px solid #17a2b8;
+    padding: 10px;
+    margin: 5px 0;
+    border-radius: 4px;
+">
+    <strong>$i.</strong> $strength
+</div>
+""")
+
+_SKILL_TPL = string.Template("""
+<div style="
+    background-color: #000000;
+    padding: 8px;
+    margin: 5px 0;
+    border-radius: 4px;
+    border: 1px solid #dee2e6;
+">
+    $skill
+</div>
+""")
+
+_SUGGESTION_TPL = string.Template("""
+<div style="
+    background-color: #03530f;
+    border-left: 5px solid #28a745;
+    padding: 10px;
+    margin: 10px 0;
+    border-radius: 4px;
+">
+    <strong>$i.</strong> $suggestion
+</div>
+""")
+
+# Prompt input budgets in characters; skills and education often sit at the
+# bottom of a resume, so its tail is kept alongside the head
+RESUME_HEAD_CHARS = 6000
+RESUME_TAIL_CHARS = 2000
+JD_MAX_CHARS = 4000
+
+# Analysis prompt; {jd} is filled in with str.replace so the JSON braces need no escaping
+_PROMPT_TEMPLATE = """
+    You are an elite Applicant Tracking System (ATS) expert with deep specialization in technical recruitment for fields including 
+    software engineering, data science, machine learning, data analysis, big data engineering, cloud computing, 
+    and IT roles. You have 15+ years of experience in technical recruiting for top tech companies.
+    
+    Analyze each of the provided resumes independently against the job description with extreme precision and provide, for every resume:
+    
+    1. A percentage match score between the resume and job description. Be realistic but fair - most candidates don't exceed 85% match.
+    2. A detailed, categorized list of important keywords/skills from the job description missing in the resume.
+       Categorize them as: Technical Skills, Soft Skills, Experience, Education/Certifications.
+    3. A compelling professional summary of the candidate's profile.
+    4. 3-5 specific, actionable recommendations to improve the resume for this particular job.
+    5. 2-3 strengths of the resume relative to the job description.
+    6. A brief explanation of why certain skills/experiences are particularly valuable for this role.
+    
+    Job Description:
+    {jd}
+    
+    Return your analysis as a JSON array with exactly one object per resume, in the following JSON format only:
+    [
+        {
+            "id": 0,
+            "JD Match": "XX%",
+            "MissingKeywords": {
+                "Technical Skills": ["skill1", "skill2", ...],
+                "Soft Skills": ["skill1", "skill2", ...],
+                "Experience": ["exp1", "exp2", ...],
+                "Education/Certifications": ["cert1", "cert2", ...]
+            },
+            "Profile Summary": "Compelling summary of the candidate's profile",
+            "Improvement Suggestions": ["suggestion1", "suggestion2", "suggestion3", ...],
+            "Resume Strengths": ["strength1", "strength2", ...],
+            "Key Role Requirements": "Brief explanation of the most critical skills for this role"
+        },
+        ...
+    ]
+    
+    The "id" of each object must match the "id" of the resume it analyzes.
+    Be thorough but ensure you maintain valid JSON format. Focus on practical, actionable insights that would genuinely help the candidate.
+    
+    Resumes:
+    """
+
+class AnalysisError(Exception):
+    """Raised when an analysis cannot be completed; the message is shown to the user"""
+
+# Sections of the results view, one of which is shown at a time
+RESULT_TABS = ["📊 Match Score", "📋 Profile Analysis", "🔍 Skills Gap", "💡 Recommendations"]
+
+# Structured output schema: one analysis object per resume, matching the prompt
+RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "id": {"type": "INTEGER"},
+            "JD Match": {"type": "STRING"},
+            "MissingKeywords": {
+                "type": "OBJECT",
+                "properties": {
+                    "Technical Skills": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "Soft Skills": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "Experience": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "Education/Certifications": {"type": "ARRAY", "items": {"type": "STRING"}}
+                }
+            },
+            "Profile Summary": {"type": "STRING"},
+            "Improvement Suggestions": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "Resume Strengths": {"type": "ARRAY", "items": {"type": "STRING"}},
+            "Key Role Requirements": {"type": "STRING"}
+        },
+        "required": [
+            "id",
+            "JD Match",
+            "MissingKeywords",
+            "Profile Summary",
+            "Improvement Suggestions",
+            "Resume Strengths",
+            "Key Role Requirements"
+        ]
+    }
+}
+
+# Lifetime and size of the cache of finished analyses
+ANALYSIS_CACHE_TTL = 3600
+ANALYSIS_CACHE_MAX_ENTRIES = 256
+
+# Number of streamed chunks between progress redraws
+STREAM_RENDER_EVERY = 5
+
+@st.cache_resource
+def get_model():
+    """Return the shared Gemini model client, built once per process.
+
+    google.generativeai pulls in protobuf/grpc, so it is only imported here, on first use.
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    logger.info("Google API configured successfully")
+    return genai.GenerativeModel('gemini-2.0-flash')
+
+def get_gemini_response(input_text: str) -> Iterator[str]:
+    """Stream the response from the Gemini model chunk by chunk"""
     logger.info("Generating response from Gemini model")
     try:
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        response = model.generate_content(input_text)
+        response = get_model().generate_content(
+            input_text,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": RESPONSE_SCHEMA
+            },
+            stream=True
+        )
+        for chunk in response:
+            yield chunk.text
         logger.info("Response generated successfully")
-        return response.text
     except Exception as e:
         logger.error(f"Error generating response: {str(e)}")
-        return None
+        raise AnalysisError("❌ Failed to get analysis from the AI model. Please try again later.") from e
 
-def extract_pdf_text(uploaded_file) -> Optional[str]:
-    """Extract and concatenate text from all pages of the given PDF file"""
-    logger.info(f"Processing PDF file: {uploaded_file.name}")
+def _extract_page_text(page) -> str:
+    """Extract the text of a single PDF page, returning an empty string on failure"""
+    try:
+        return page.get_text("text")
+    except Exception as e:
+        logger.warning(f"Skipping unreadable PDF page {page.number + 1}: {str(e)}")
+        return ""
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _extract_pdf_bytes(pdf_bytes: bytes) -> Optional[str]:
+    """Extract and concatenate text from all pages of a PDF given as raw bytes"""
+    # Imported outside the try so a missing PyMuPDF isn't reported as a bad PDF
+    import fitz
     try:
-        reader = pdf.PdfReader(uploaded_file)
-        text = ""
-        # Iterate through all the pages
-        for page in range(len(reader.pages)):
-            page_content = reader.pages[page]
-            # Extracting the text
-            text += str(page_content.extract_text())
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        page_count = doc.page_count
+        # A malformed page only loses its own text, not the whole resume
+        text = "\n".join(_extract_page_text(page) for page in doc)
+        doc.close()
         
         if not text.strip():
             logger.warning("Extracted text is empty")
             return None
             
-        logger.info(f"Successfully extracted text from PDF with {len(reader.pages)} pages")
+        logger.info(f"Successfully extracted text from PDF with {page_count} pages")
         return text
     except Exception as e:
         logger.error(f"Error processing PDF: {str(e)}")
         return None
 
-def parse_gemini_response(response: str) -> Dict[str, Any]:
-    """Parse the JSON response from Gemini with error handling"""
-    try:
-        # Clean the response to ensure it's valid JSON
-        # Sometimes the model might return additional text around the JSON
-        response = response.strip()
-        
-        # Find JSON content (anything between { and })
-        start_idx = response.find('{')
-        end_idx = response.rfind('}') + 1
-        
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = response[start_idx:end_idx]
-            result = json.loads(json_str)
-            logger.info("Successfully parsed JSON response")
-            return result
-        else:
-            logger.error("Could not find valid JSON in response")
-            return {"error": "Invalid response format", "raw_response": response}
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON parsing error: {str(e)}")
-        return {"error": "Failed to parse response", "raw_response": response}
+def extract_pdf_text(uploaded_file) -> Optional[str]:
+    """Extract text from the uploaded PDF, memoized on the file contents"""
+    logger.info(f"Processing PDF file: {uploaded_file.name}")
+    return _extract_pdf_bytes(uploaded_file.getvalue())
 
-def create_prompt(resume_text: str, job_description: str) -> str:
-    """Create a well-structured prompt for the Gemini model"""
-    prompt = """
-    You are an elite Applicant Tracking System (ATS) expert with deep specialization in technical recruitment for fields including 
-    software engineering, data science, machine learning, data analysis, big data engineering, cloud computing, 
-    and IT roles. You have 15+ years of experience in technical recruiting for top tech companies.
-    
-    Analyze the provided resume against the job description with extreme precision and provide:
-    
-    1. A percentage match score between the resume and job description. Be realistic but fair - most candidates don't exceed 85% match.
-    2. A detailed, categorized list of important keywords/skills from the job description missing in the resume.
-       Categorize them as: Technical Skills, Soft Skills, Experience, Education/Certifications.
-    3. A compelling professional summary of the candidate's profile.
-    4. 3-5 specific, actionable recommendations to improve the resume for this particular job.
-    5. 2-3 strengths of the resume relative to the job description.
-    6. A brief explanation of why certain skills/experiences are particularly valuable for this role.
+@st.cache_resource
+def get_pdf_executor() -> ThreadPoolExecutor:
+    """Return the background pool for PDF extraction, shared across reruns and sessions"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def pdf_key(uploaded_file) -> str:
+    """Content hash identifying an uploaded PDF; called once per upload"""
+    return hashlib.file_digest(uploaded_file, "sha256").hexdigest()
+
+def start_pdf_extraction(uploaded_files) -> List[str]:
+    """Start text extraction for each upload in the background, once per file.
+
+    Futures live in the session state so extraction overlaps with the user typing
+    the job description. Returns the content keys of the uploads, in order.
+    """
+    # Each upload is hashed once; later reruns look its key up by file_id
+    previous_hashes = st.session_state.get("pdf_hashes", {})
+    hashes = {}
+    for uploaded_file in uploaded_files:
+        key = previous_hashes.get(uploaded_file.file_id)
+        hashes[uploaded_file.file_id] = key if key is not None else pdf_key(uploaded_file)
+    st.session_state["pdf_hashes"] = hashes
     
-    Resume:
-    {resume}
+    keys = [hashes[uploaded_file.file_id] for uploaded_file in uploaded_files]
     
-    Job Description:
-    {jd}
+    # Drop texts and futures for files that are no longer uploaded
+    previous_texts = st.session_state.get("pdf_texts", {})
+    pdf_texts = {key: previous_texts[key] for key in keys if key in previous_texts}
+    st.session_state["pdf_texts"] = pdf_texts
     
-    Return your analysis in the following JSON format only:
-    {{
-        "JD Match": "XX%",
-        "MissingKeywords": {{
-            "Technical Skills": ["skill1", "skill2", ...],
-            "Soft Skills": ["skill1", "skill2", ...],
-            "Experience": ["exp1", "exp2", ...],
-            "Education/Certifications": ["cert1", "cert2", ...]
-        }},
-        "Profile Summary": "Compelling summary of the candidate's profile",
-        "Improvement Suggestions": ["suggestion1", "suggestion2", "suggestion3", ...],
-        "Resume Strengths": ["strength1", "strength2", ...],
-        "Key Role Requirements": "Brief explanation of the most critical skills for this role"
-    }}
+    previous = st.session_state.get("pdf_futures", {})
+    futures = {}
+    for uploaded_file, key in zip(uploaded_files, keys):
+        if key in pdf_texts:
+            continue
+        # The same PDF may appear more than once in a batch
+        future = futures.get(key) or previous.get(key)
+        if future is None:
+            future = get_pdf_executor().submit(extract_pdf_text, uploaded_file)
+        futures[key] = future
+    st.session_state["pdf_futures"] = futures
+    return keys
+
+def get_pdf_text(key: str) -> Optional[str]:
+    """Return the extracted text for an upload, waiting for its extraction if needed.
+
+    Results are kept in the session state by content hash, so the preview and the
+    analysis never extract the same file twice, even with caching disabled.
+    """
+    pdf_texts = st.session_state.setdefault("pdf_texts", {})
+    if key not in pdf_texts:
+        pdf_texts[key] = st.session_state["pdf_futures"].pop(key).result()
+    return pdf_texts[key]
+
+def parse_gemini_response(response: str) -> Any:
+    """Parse the JSON response from Gemini, raising AnalysisError if it is invalid"""
+    try:
+        result = orjson.loads(response)
+        logger.info("Successfully parsed JSON response")
+        return result
+    except orjson.JSONDecodeError as e:
+        logger.error(f"JSON parsing error: {str(e)}")
+        raise AnalysisError("❌ The AI model returned an invalid analysis. Please try again.") from e
+
+def truncate_resume(resume_text: str) -> str:
+    """Clip a resume to its head and tail, where most of the signal usually is"""
+    limit = RESUME_HEAD_CHARS + RESUME_TAIL_CHARS
+    if len(resume_text) <= limit:
+        return resume_text
+    logger.info(f"Truncating resume text from {len(resume_text)} to {limit} characters")
+    return resume_text[:RESUME_HEAD_CHARS] + "\n...\n" + resume_text[-RESUME_TAIL_CHARS:]
+
+def truncate_job_description(job_description: str) -> str:
+    """Clip a job description to the prompt budget"""
+    if len(job_description) <= JD_MAX_CHARS:
+        return job_description
+    logger.info(f"Truncating job description from {len(job_description)} to {JD_MAX_CHARS} characters")
+    return job_description[:JD_MAX_CHARS]
+
+def create_prompt(resume_texts: Sequence[str], job_description: str) -> str:
+    """Create a well-structured prompt for the Gemini model.
+
+    The instructions and job description form a shared prefix, and the resumes are
+    appended last so that a whole batch is analyzed in a single request.
+    """
+    resumes = json.dumps(
+        [{"id": i, "resume": truncate_resume(text)} for i, text in enumerate(resume_texts)],
+        ensure_ascii=False,
+        indent=2
+    )
+    return _PROMPT_TEMPLATE.replace("{jd}", truncate_job_description(job_description), 1) + resumes
+
+def split_batch_results(parsed: Any, count: int) -> List[Dict[str, Any]]:
+    """Map a parsed batch response back onto the resumes by their id.
+
+    Raises AnalysisError if any resume is missing from the response.
+    """
+    by_id = {}
+    for item in parsed if isinstance(parsed, list) else []:
+        if isinstance(item, dict):
+            by_id[str(item.get("id"))] = item
     
-    Be thorough but ensure you maintain valid JSON format. Focus on practical, actionable insights that would genuinely help the candidate.
+    results = []
+    for i in range(count):
+        result = by_id.get(str(i))
+        if result is None:
+            logger.error(f"No analysis returned for resume {i}")
+            raise AnalysisError("❌ The AI model returned an incomplete analysis. Please try again.")
+        results.append(result)
+    return results
+
+class AnalysisCache:
+    """Thread-safe LRU cache of finished analyses with a time-to-live"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached results for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return results
+
+    def put(self, key: str, results: List[Dict[str, Any]]):
+        """Store results under key, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def get_analysis_cache() -> AnalysisCache:
+    """Return the process-wide cache of finished analyses"""
+    return AnalysisCache(ANALYSIS_CACHE_TTL, ANALYSIS_CACHE_MAX_ENTRIES)
+
+def analysis_key(resume_texts: Sequence[str], job_description: str) -> str:
+    """Content hash identifying a batch of resumes analyzed against one JD"""
+    payload = json.dumps([list(resume_texts), job_description], ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def stream_analysis(resume_texts: Sequence[str], job_description: str, placeholder) -> List[Dict[str, Any]]:
+    """Analyze a batch of resumes against one JD, drawing the response into placeholder as it streams.
+
+    Returns one result dict per resume, in upload order, and raises AnalysisError
+    unless every resume received a complete analysis.
     """
+    prompt = create_prompt(resume_texts, job_description)
     
-    return prompt.format(resume=resume_text, jd=job_description)
-
-def display_results(analysis_results: Dict[str, Any]):
-    """Display the analysis results in a user-friendly format"""
-    if "error" in analysis_results:
-        st.error("Error analyzing the resume")
-        st.write("Raw response:")
-        st.write(analysis_results.get("raw_response", "No response available"))
-        return
+    # Show the response as it streams in, starting with the first chunk; the
+    # placeholder is cleared once done
+    buf = []
+    for i, chunk in enumerate(get_gemini_response(prompt), 1):
+        buf.append(chunk)
+        if i == 1 or i % STREAM_RENDER_EVERY == 0:
+            placeholder.code("".join(buf), language="json")
+    placeholder.empty()
     
+    response = "".join(buf)
+    if not response.strip():
+        raise AnalysisError("❌ Failed to get analysis from the AI model. Please try again later.")
+
+    return split_batch_results(parse_gemini_response(response), len(resume_texts))
+
+def display_results(analysis_results: Dict[str, Any], active_tab: str):
+    """Display the selected section of the analysis results in a user-friendly format"""
     try:
-        # Create tabs for organized display
-        tab1, tab2, tab3, tab4 = st.tabs(["📊 Match Score", "📋 Profile Analysis", "🔍 Skills Gap", "💡 Recommendations"])
-        
-        with tab1:
+        # Only the selected section is built; the others cost nothing on reruns
+        if active_tab == RESULT_TABS[0]:
             # Display match percentage with an attractive gauge
             match_percentage = analysis_results.get("JD Match", "N/A")
             
@@ -172,38 +478,15 @@ def display_results(analysis_results: Dict[str, Any]):
                 # Create a centered column for the gauge
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
-                    st.markdown(f"<h1 style='text-align: center; color: {color};'>{match_percentage}</h1>", unsafe_allow_html=True)
-                    st.markdown(f"<h3 style='text-align: center;'>{emoji} {message}</h3>", unsafe_allow_html=True)
-                    
-                    # Create a more attractive circular gauge
-                    html_gauge = f"""
-                    <div style="display: flex; justify-content: center; margin: 20px 0;">
-                        <div style="
-                            width: 200px;
-                            height: 200px;
-                            border-radius: 50%;
-                            background: conic-gradient({color} {match_value}%, #f3f3f3 0);
-                            display: flex;
-                            align-items: center;
-                            justify-content: center;
-                        ">
-                            <div style="
-                                width: 150px;
-                                height: 150px;
-                                border-radius: 50%;
-                                background: white;
-                                display: flex;
-                                align-items: center;
-                                justify-content: center;
-                                font-size: 24px;
-                                font-weight: bold;
-                            ">
-                                {match_percentage}
-                            </div>
-                        </div>
-                    </div>
-                    """
-                    st.markdown(html_gauge, unsafe_allow_html=True)
+                    # Score heading and circular SVG gauge, sent as a single element
+                    html_gauge = _GAUGE_TPL.substitute(
+                        color=color,
+                        emoji=emoji,
+                        message=message,
+                        match_value=match_value,
+                        match_percentage=match_percentage
+                    )
+                    st.html(html_gauge)
                     
                     # Score interpretation
                     st.markdown("""
@@ -216,11 +499,11 @@ def display_results(analysis_results: Dict[str, Any]):
             except (ValueError, TypeError):
                 st.write(f"Match Percentage: {match_percentage}")
                 
-        with tab2:
+        elif active_tab == RESULT_TABS[1]:
             # Display profile summary with enhanced styling
             st.markdown("### Professional Profile Summary")
             profile_summary = analysis_results.get("Profile Summary", "No summary available")
-            st.markdown(f"""
+            st.html(f"""
             <div style="
                 background-color: #000000;
                 border-left: 5px solid #6c757d;
@@ -229,30 +512,20 @@ def display_results(analysis_results: Dict[str, Any]):
             ">
                 {profile_summary}
             </div>
-            """, unsafe_allow_html=True)
+            """)
             
             # Display resume strengths
             strengths = analysis_results.get("Resume Strengths", [])
             if isinstance(strengths, list) and strengths:
                 st.markdown("### Resume Strengths")
-                for i, strength in enumerate(strengths, 1):
-                    st.markdown(f"""
-                    <div style="
-                        background-color: #000000;
-                        border-left: 5px solid #17a2b8;
-                        padding: 10px;
-                        margin: 5px 0;
-                        border-radius: 4px;
-                    ">
-                        <strong>{i}.</strong> {strength}
-                    </div>
-                    """, unsafe_allow_html=True)
+                strengths_html = "".join(_STRENGTH_TPL.substitute(i=i, strength=strength) for i, strength in enumerate(strengths, 1))
+                st.html(strengths_html)
             
             # Display key role requirements
             key_reqs = analysis_results.get("Key Role Requirements", "")
             if key_reqs:
                 st.markdown("### Critical Skills for This Role")
-                st.markdown(f"""
+                st.html(f"""
                 <div style="
                     background-color: #bf80ff;
                     border-left: 5px solid #4d0099;
@@ -261,9 +534,9 @@ def display_results(analysis_results: Dict[str, Any]):
                 ">
                     {key_reqs}
                 </div>
-                """, unsafe_allow_html=True)
+                """)
                 
-        with tab3:
+        elif active_tab == RESULT_TABS[2]:
             # Display missing keywords
             missing_keywords = analysis_results.get("MissingKeywords", {})
             if isinstance(missing_keywords, dict) and missing_keywords:
@@ -284,31 +557,14 @@ def display_results(analysis_results: Dict[str, Any]):
                             col1, col2 = st.columns(2)
                             half = len(skills) // 2 + len(skills) % 2
                             
-                            for i, skill in enumerate(skills[:half]):
-                                col1.markdown(f"""
-                                <div style="
-                                    background-color: #000000;
-                                    padding: 8px;
-                                    margin: 5px 0;
-                                    border-radius: 4px;
-                                    border: 1px solid #dee2e6;
-                                ">
-                                    {skill}
-                                </div>
-                                """, unsafe_allow_html=True)
-                                
-                            for i, skill in enumerate(skills[half:]):
-                                col2.markdown(f"""
-                                <div style="
-                                    background-color: #000000;
-                                    padding: 8px;
-                                    margin: 5px 0;
-                                    border-radius: 4px;
-                                    border: 1px solid #dee2e6;
-                                ">
-                                    {skill}
-                                </div>
-                                """, unsafe_allow_html=True)
+                            # One HTML element per column instead of one per skill
+                            left_html = "".join(_SKILL_TPL.substitute(skill=skill) for skill in skills[:half])
+                            if left_html:
+                                col1.html(left_html)
+                            
+                            right_html = "".join(_SKILL_TPL.substitute(skill=skill) for skill in skills[half:])
+                            if right_html:
+                                col2.html(right_html)
             elif isinstance(missing_keywords, list) and missing_keywords:
                 # Handle old format for backwards compatibility
                 st.markdown("### Missing Keywords")
@@ -317,23 +573,13 @@ def display_results(analysis_results: Dict[str, Any]):
             else:
                 st.write("No missing keywords found or unable to parse keywords.")
                 
-        with tab4:
+        elif active_tab == RESULT_TABS[3]:
             # Display improvement suggestions
             suggestions = analysis_results.get("Improvement Suggestions", [])
             if isinstance(suggestions, list) and suggestions:
                 st.markdown("### Actionable Recommendations")
-                for i, suggestion in enumerate(suggestions, 1):
-                    st.markdown(f"""
-                    <div style="
-                        background-color: #03530f;
-                        border-left: 5px solid #28a745;
-                        padding: 10px;
-                        margin: 10px 0;
-                        border-radius: 4px;
-                    ">
-                        <strong>{i}.</strong> {suggestion}
-                    </div>
-                    """, unsafe_allow_html=True)
+                suggestions_html = "".join(_SUGGESTION_TPL.substitute(i=i, suggestion=suggestion) for i, suggestion in enumerate(suggestions, 1))
+                st.html(suggestions_html)
                     
                 # Add a "Next Steps" section
                 st.markdown("### Next Steps")
@@ -351,6 +597,20 @@ def display_results(analysis_results: Dict[str, Any]):
         st.write("Raw data:")
         st.write(analysis_results)
 
+@st.fragment
+def display_analysis(analysis: List[Tuple[str, Dict[str, Any]]]):
+    """Display the section picker and the results for every analyzed resume.
+
+    Runs as a fragment, so switching sections reruns only this function rather
+    than the whole page.
+    """
+    active_tab = st.radio("📑 Results Section", RESULT_TABS, key="active_tab", horizontal=True)
+    
+    for name, result in analysis:
+        if len(analysis) > 1:
+            st.markdown(f"### 📄 {name}")
+        display_results(result, active_tab)
+
 # Streamlit UI
 def main():
     st.set_page_config(
@@ -360,50 +620,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Custom CSS with improved tab styling
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #000000;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: #2c3e50;
-        color: #f8f9fa;
-        border-radius: 4px 4px 0 0;
-        gap: 1px;
-        padding-top: 10px;
-        padding-bottom: 10px;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #212529;
-        color: #ffffff;
-        border-bottom: 2px solid #17a2b8;
-        font-weight: 600;
-    }
-    div.block-container {
-        padding-top: 2rem;
-    }
-    h1, h2, h3 {
-        color: #2c3e50;
-    }
-    .stButton>button {
-        background-color: #4e89ae;
-        color: white;
-        font-weight: bold;
-        height: 3em;
-        border-radius: 0.5rem;
-    }
-    .stButton>button:hover {
-        background-color: #2c3e50;
-        color: white;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Custom CSS; re-emitted on every rerun since
+    # Streamlit clears elements that a run does not write
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     # Sidebar
     with st.sidebar:
@@ -413,7 +632,7 @@ def main():
         st.markdown("---")
         st.markdown("""
         **How it works:**
-        1. Upload your resume (PDF)
+        1. Upload one or more resumes (PDF)
         2. Paste the job description
         3. Click 'Analyze Resume'
         4. Get insights to improve your chances
@@ -443,23 +662,27 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            uploaded_file = st.file_uploader(
-                "📄 Upload Your Resume (PDF)", 
+            uploaded_files = st.file_uploader(
+                "📄 Upload Your Resume(s) (PDF)", 
                 type="pdf",
-                help="Please upload a PDF file"
+                accept_multiple_files=True,
+                help="Please upload one or more PDF files"
             )
             
-            if uploaded_file:
-                st.success(f"✅ File uploaded: {uploaded_file.name}")
+            pdf_keys = start_pdf_extraction(uploaded_files or [])
+            
+            if uploaded_files:
+                st.success(f"✅ Files uploaded: {', '.join(f.name for f in uploaded_files)}")
                 
                 # Show preview option
                 if st.checkbox("👁️ Preview Resume Text"):
                     with st.spinner("Extracting text..."):
-                        preview_text = extract_pdf_text(uploaded_file)
-                        if preview_text:
-                            st.text_area("Resume Text Preview", preview_text, height=200)
-                        else:
-                            st.warning("⚠️ Could not extract text from the PDF. The file may be scanned or protected.")
+                        for i, (uploaded_file, key) in enumerate(zip(uploaded_files, pdf_keys)):
+                            preview_text = get_pdf_text(key)
+                            if preview_text:
+                                st.text_area(f"Resume Text Preview: {uploaded_file.name}", preview_text, height=200, key=f"preview_{i}")
+                            else:
+                                st.warning(f"⚠️ Could not extract text from {uploaded_file.name}. The file may be scanned or protected.")
         
         with col2:
             job_description = st.text_area(
@@ -496,7 +719,7 @@ def main():
     
     # Analysis section
     if analyze_button:
-        if not uploaded_file:
+        if not uploaded_files:
             st.warning("⚠️ Please upload a resume PDF file")
             return
             
@@ -505,39 +728,56 @@ def main():
             return
         
         with st.spinner("🔍 AI is analyzing your resume... This may take up to 30 seconds"):
-            # Extract text from PDF
-            resume_text = extract_pdf_text(uploaded_file)
-            
-            if not resume_text:
-                st.error("❌ Could not extract text from the uploaded PDF. Please check if the file is properly formatted or not password protected.")
-                return
-                
-            # Create prompt and get response
-            prompt = create_prompt(resume_text, job_description)
-            response = get_gemini_response(prompt)
-            
-            if not response:
-                st.error("❌ Failed to get analysis from the AI model. Please try again later.")
-                return
+            resume_texts = []
+            for uploaded_file, key in zip(uploaded_files, pdf_keys):
+                resume_text = get_pdf_text(key)
+                if not resume_text:
+                    st.error(f"❌ Could not extract text from {uploaded_file.name}. Please check if the file is properly formatted or not password protected.")
+                    return
+                resume_texts.append(resume_text)
                 
-            # Parse and display results
-            st.markdown("## 📊 Resume Analysis Results")
-            st.markdown("<div style='border-top: 1px solid #e6e6e6; margin-bottom: 30px;'></div>", unsafe_allow_html=True)
-            
-            analysis_results = parse_gemini_response(response)
-            display_results(analysis_results)
+            # Identical inputs reuse the earlier result; only a miss calls Gemini
+            cache = get_analysis_cache()
+            key = analysis_key(resume_texts, job_description)
+            analysis_results = cache.get(key)
+            if analysis_results is None:
+                try:
+                    analysis_results = stream_analysis(resume_texts, job_description, st.empty())
+                except AnalysisError as e:
+                    st.error(str(e))
+                    return
+                cache.put(key, analysis_results)
             
-            # Log completion
+            # Keep the results, along with the inputs they belong to, so switching
+            # sections doesn't require a new analysis
+            st.session_state["analysis"] = [
+                (uploaded_file.name, result)
+                for uploaded_file, result in zip(uploaded_files, analysis_results)
+            ]
+            st.session_state["analysis_inputs"] = (tuple(pdf_keys), job_description)
             logger.info("Analysis completed and displayed to user")
-            
-            # Footer
-            st.markdown("<div style='border-top: 1px solid #e6e6e6; margin-top: 30px;'></div>", unsafe_allow_html=True)
-            st.markdown("""
-            <div style="text-align: center; margin-top: 20px; color: #6c757d;">
-                ResumeAI helps you optimize your resume for Applicant Tracking Systems (ATS)<br>
-                Powered by Google Gemini 2.0 AI and Aniketh and Animesh!
-            </div>
-            """, unsafe_allow_html=True)
+    
+    # Drop results that no longer match the uploaded files or the JD
+    if st.session_state.get("analysis_inputs") != (tuple(pdf_keys), job_description):
+        st.session_state.pop("analysis", None)
+        st.session_state.pop("analysis_inputs", None)
+    
+    # Results section
+    if "analysis" in st.session_state:
+        analysis = st.session_state["analysis"]
+        st.markdown("## 📊 Resume Analysis Results")
+        st.markdown("<div style='border-top: 1px solid #e6e6e6; margin-bottom: 30px;'></div>", unsafe_allow_html=True)
+        
+        display_analysis(analysis)
+        
+        # Footer
+        st.markdown("<div style='border-top: 1px solid #e6e6e6; margin-top: 30px;'></div>", unsafe_allow_html=True)
+        st.markdown("""
+        <div style="text-align: center; margin-top: 20px; color: #6c757d;">
+            ResumeAI helps you optimize your resume for Applicant Tracking Systems (ATS)<br>
+            Powered by Google Gemini 2.0 AI and Aniketh and Animesh!
+        </div>
+        """, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file